@@ -1,34 +1,339 @@
+import contextlib
+import json
 import logging
 import os
 import sys
-from typing import Optional, Tuple
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import torch
 import torch.distributed as dist
+import torch.nn as nn
+import torch.nn.functional as F
 import torchvision.datasets as datasets
-from torch.utils.data import DataLoader, DistributedSampler, random_split
+from torch.utils.data import DataLoader, DistributedSampler, Sampler
 from torchvision import transforms
 
 
-def calculate_mean_std(loader: DataLoader) -> Tuple[float, float]:
+def calculate_mean_std(loader: DataLoader) -> Tuple[torch.Tensor, torch.Tensor]:
     """
     Helper function for get the mean and standard deviation of the dataset.
+
+    Accumulates per-channel sums and sums of squares in a single pass, so the result is the
+    exact population statistics over all pixels (per-batch stds are not additive).
     """
-    mean = 0.0
-    std = 0.0
-    total_images_count = 0
+    channel_sum = 0.0
+    channel_sq_sum = 0.0
+    count = 0
 
     for images, _ in loader:
         # Reshape [B, C, W, H] -> [B, C, W * H]
-        images = images.view(images.size(0), images.size(1), -1)
-        # Update total number of images
-        total_images_count += images.size(0)
-        # Compute mean and std for this batch
-        mean += images.mean(2).sum(0)
-        std += images.std(2).sum(0)
+        images = images.view(images.size(0), images.size(1), -1).double()
+        channel_sum += images.sum(dim=(0, 2))
+        channel_sq_sum += images.square().sum(dim=(0, 2))
+        count += images.size(0) * images.size(2)
+
+    mean = channel_sum / count
+    var = channel_sq_sum / count - mean.square()
+    std = var.clamp_min(0).sqrt()
+    return mean.float(), std.float()
+
+
+def calculate_mean_std_from_data(
+    data: np.ndarray, chunk_size: int = 1024
+) -> Tuple[List[float], List[float]]:
+    """
+    Compute the per-channel mean and standard deviation of a raw uint8 `[N, H, W, C]`
+    image array (e.g. `CIFAR100.data`) in a single pass.
+
+    Per-channel sums and sums of squares are accumulated as exact int64 over chunks of
+    `chunk_size` images, so no float copy of the whole dataset is materialized.
+    """
+    channels = data.shape[-1]
+    channel_sum = np.zeros(channels, dtype=np.int64)
+    channel_sq_sum = np.zeros(channels, dtype=np.int64)
+
+    for start in range(0, data.shape[0], chunk_size):
+        pixels = data[start : start + chunk_size].reshape(-1, channels).astype(np.int64)
+        channel_sum += pixels.sum(axis=0)
+        channel_sq_sum += np.einsum("ij,ij->j", pixels, pixels)
+
+    count = data.size // channels
+    mean = channel_sum / count
+    var = np.maximum(channel_sq_sum / count - mean**2, 0.0)
+    std = np.sqrt(var) / 255.0
+    return (mean / 255.0).tolist(), std.tolist()
+
+
+class InMemoryCIFAR(torch.utils.data.Dataset):
+    """
+    CIFAR dataset held entirely in RAM as a single uint8 `[N, C, H, W]` tensor.
+
+    Samples are never converted to PIL images, so `transform` must operate on uint8
+    image tensors (e.g. `ConvertImageDtype` instead of `ToTensor`).
+    """
+
+    def __init__(self, images: np.ndarray, targets: np.ndarray, transform=None):
+        # One copy from the (possibly memory-mapped) `[N, H, W, C]` array into CHW layout
+        self.images = torch.from_numpy(
+            np.ascontiguousarray(images.transpose(0, 3, 1, 2))
+        )
+        self.targets = torch.as_tensor(targets, dtype=torch.long)
+        self.transform = transform
 
-    # Normalize by the total number of images
-    mean /= total_images_count
-    std /= total_images_count
-    return mean, std
+    def __len__(self) -> int:
+        return self.targets.size(0)
+
+    def __getitem__(self, index: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        image = self.images[index]
+        if self.transform is not None:
+            image = self.transform(image)
+        return image, self.targets[index]
+
+
+class NormalizeLUT:
+    """
+    Map a uint8 `[C, H, W]` image tensor to normalized float32 with one table lookup.
+
+    Replaces `ConvertImageDtype(torch.float32)` followed by `Normalize(mean, std)`: the
+    256 possible values of each channel are normalized once up front.
+    """
+
+    def __init__(self, mean: List[float], std: List[float]):
+        mean = torch.as_tensor(mean, dtype=torch.float32).view(-1, 1)
+        std = torch.as_tensor(std, dtype=torch.float32).view(-1, 1)
+        # [C, 256] table of normalized values
+        self.lut = (torch.arange(256, dtype=torch.float32) / 255.0 - mean) / std
+        self.channels = torch.arange(self.lut.size(0)).view(-1, 1, 1)
+
+    def __call__(self, image: torch.Tensor) -> torch.Tensor:
+        return self.lut[self.channels, image.long()]
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(channels={self.lut.size(0)})"
+
+
+class DeviceBatchTransform(nn.Module):
+    """
+    Batched augmentation and normalization of raw uint8 images, run on the accelerator
+    after the host-to-device copy.
+
+    When `augment` is set, random crop (zero padding), horizontal flip and rotation are
+    folded into one per-sample affine warp, so the whole batch is resampled once.
+    """
+
+    def __init__(
+        self,
+        mean: List[float],
+        std: List[float],
+        augment: bool = False,
+        padding: int = 4,
+        degrees: float = 15.0,
+    ):
+        super().__init__()
+        self.augment = augment
+        self.padding = padding
+        self.degrees = degrees
+        self.register_buffer(
+            "mean", torch.as_tensor(mean, dtype=torch.float32).view(1, -1, 1, 1)
+        )
+        self.register_buffer(
+            "std", torch.as_tensor(std, dtype=torch.float32).view(1, -1, 1, 1)
+        )
+
+    @torch.no_grad()
+    def forward(self, images: torch.Tensor) -> torch.Tensor:
+        images = images.float().div_(255.0)
+        if self.augment:
+            images = self.random_affine(images)
+        return images.sub_(self.mean).div_(self.std)
+
+    def random_affine(self, images: torch.Tensor) -> torch.Tensor:
+        batch_size, _, height, width = images.shape
+        device = images.device
+
+        angle = torch.deg2rad(
+            torch.empty(batch_size, device=device).uniform_(-self.degrees, self.degrees)
+        )
+        # -1 mirrors the x axis, +1 keeps it
+        flip = torch.randint(0, 2, (batch_size,), device=device).float() * 2 - 1
+        shift = torch.randint(
+            -self.padding, self.padding + 1, (batch_size, 2), device=device
+        ).float()
+        cos, sin = angle.cos(), angle.sin()
+
+        # affine_grid maps output coordinates to input coordinates in [-1, 1]
+        theta = torch.stack(
+            [
+                torch.stack([cos * flip, -sin, shift[:, 0] * 2 / width], dim=1),
+                torch.stack([sin * flip, cos, shift[:, 1] * 2 / height], dim=1),
+            ],
+            dim=1,
+        )
+        grid = F.affine_grid(theta, list(images.shape), align_corners=False)
+        return F.grid_sample(
+            images, grid, mode="nearest", padding_mode="zeros", align_corners=False
+        )
+
+
+class NPUPrefetcher:
+    """
+    Wrap a DataLoader so that batches are yielded on `device`, with an optional batched
+    transform applied to the images after the copy.
+
+    The copy (and transform) of the next batch is issued on a dedicated device stream
+    while the current batch is being consumed, so host-to-device transfer overlaps with
+    compute. On devices without streams (CPU) batches are moved synchronously.
+
+    Floating-point images are finally converted to `dtype` and `memory_format`, matching
+    the layout and precision of the model parameters.
+
+    `dataset`, `sampler` and `len()` are forwarded, and the raw loader stays available
+    as `loader`, so the prefetcher can stand in for the underlying loader.
+    """
+
+    def __init__(
+        self,
+        loader: DataLoader,
+        device: torch.device,
+        batch_transform: Optional[Callable[[torch.Tensor], torch.Tensor]] = None,
+        dtype: torch.dtype = torch.float32,
+        memory_format: torch.memory_format = torch.contiguous_format,
+    ):
+        self.loader = loader
+        self.device = device
+        self.batch_transform = batch_transform
+        self.dtype = dtype
+        self.memory_format = memory_format
+
+        # torch.npu (registered by torch_npu) and torch.cuda expose the same stream API.
+        # torch.cpu also defines a `Stream` stub, but it is not a real device stream, so
+        # CPU batches are copied synchronously instead.
+        self.device_module = getattr(torch, device.type, None)
+        if device.type != "cpu" and self.device_module is not None:
+            self.stream = self.device_module.Stream(device)
+        else:
+            self.stream = None
+
+    @property
+    def dataset(self):
+        return self.loader.dataset
+
+    @property
+    def sampler(self):
+        return self.loader.sampler
+
+    def __len__(self) -> int:
+        return len(self.loader)
+
+    def __iter__(self) -> Iterator[Tuple[torch.Tensor, torch.Tensor]]:
+        batches = iter(self.loader)
+        next_batch = self.preload(batches)
+        while next_batch is not None:
+            images, target = next_batch
+            if self.stream is not None:
+                current_stream = self.device_module.current_stream(self.device)
+                current_stream.wait_stream(self.stream)
+                # The tensors were allocated on the side stream but are used on this one
+                images.record_stream(current_stream)
+                target.record_stream(current_stream)
+
+            next_batch = self.preload(batches)
+            yield images, target
+
+    def preload(
+        self, batches: Iterator[Tuple[torch.Tensor, torch.Tensor]]
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor]]:
+        try:
+            images, target = next(batches)
+        except StopIteration:
+            return None
+
+        stream_context = (
+            self.device_module.stream(self.stream)
+            if self.stream is not None
+            else contextlib.nullcontext()
+        )
+        with stream_context:
+            images = images.to(self.device, non_blocking=True)
+            target = target.to(self.device, non_blocking=True)
+            if self.batch_transform is not None:
+                images = self.batch_transform(images)
+            if images.is_floating_point():
+                images = images.to(dtype=self.dtype, memory_format=self.memory_format)
+        return images, target
+
+
+class TransformedSubset(torch.utils.data.Dataset):
+    """
+    View of `dataset` restricted to `indices` that applies its own `transform` to the images.
+
+    Lets the training and validation splits share one underlying dataset while each keeps
+    its own transform.
+    """
+
+    def __init__(self, dataset, indices: np.ndarray, transform=None):
+        self.dataset = dataset
+        self.indices = indices
+        self.transform = transform
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __getitem__(self, index: int):
+        image, target = self.dataset[int(self.indices[index])]
+        if self.transform is not None:
+            image = self.transform(image)
+        return image, target
+
+
+class ShardShuffleSampler(Sampler):
+    """
+    Random sampler over a dataset that already holds only this rank's shard.
+
+    Unlike `DistributedSampler` it does not re-partition the data every epoch: the order
+    within the shard is reshuffled from `seed + epoch`, set through `set_epoch`.
+    """
+
+    def __init__(self, num_samples: int, seed: int = 0):
+        self.num_samples = num_samples
+        self.seed = seed
+        self.epoch = 0
+
+    def set_epoch(self, epoch: int) -> None:
+        self.epoch = epoch
+
+    def __iter__(self) -> Iterator[int]:
+        generator = torch.Generator()
+        generator.manual_seed(self.seed + self.epoch)
+        return iter(torch.randperm(self.num_samples, generator=generator).tolist())
+
+    def __len__(self) -> int:
+        return self.num_samples
+
+
+def shard_dataset(dataset, rank: int, world_size: int) -> TransformedSubset:
+    """
+    Return the contiguous slice of `dataset` owned by `rank`.
+
+    Every shard has the same length (the remainder is dropped) so that all ranks run the
+    same number of steps. Slices of a `TransformedSubset` index the base dataset directly.
+    """
+    shard_size = len(dataset) // world_size
+    positions = np.arange(rank * shard_size, (rank + 1) * shard_size)
+    if isinstance(dataset, TransformedSubset):
+        return TransformedSubset(
+            dataset.dataset, dataset.indices[positions], transform=dataset.transform
+        )
+    return TransformedSubset(dataset, positions)
+
+
+def is_local_primary() -> bool:
+    """
+    Whether this process is local rank 0 of its node. The dataset path may be local to each
+    node, so downloads and cache writes happen once per node rather than once per job.
+    """
+    return int(os.getenv("LOCAL_RANK", "0")) == 0
 
 
 # Function to temporarily suppress stdout
@@ -71,18 +376,120 @@ class DataLoaderManager:
     def verify_and_download_dataset(self):
         """
         Verify if the dataset exists and initialize dataset download if necessary using `get_dataset`.
+
+        In distributed runs only local rank 0 downloads (`data.path` may be node-local), so this
+        must be called on local rank 0 of every node and followed by a `dist.barrier()` before
+        the other ranks build their datasets.
         """
         # Here, simply calling get_dataset with a basic setup will ensure that the dataset is downloaded if not present.
         _, _, _ = self.get_dataset(train_ratio=0.9)  # Adjust train_ratio as needed
         self.logger.debug(f"Dataset verified and ready at '{self.dataset_path}'.")
 
+    def should_download(self) -> bool:
+        """
+        Whether this process may download the dataset: only local rank 0 of each node does,
+        the other ranks of the node wait at a barrier and read the files it prepared.
+        """
+        return self.download and is_local_primary()
+
+    def get_dataset_class(self):
+        """
+        Return the torchvision dataset class for `dataset_name`.
+        """
+        dataset_classes = {
+            "cifar10": datasets.CIFAR10,
+            "cifar100": datasets.CIFAR100,
+        }
+        Dataset = dataset_classes[self.dataset_name]
+        Dataset.download = suppress_print(Dataset.download)
+        return Dataset
+
+    def load_raw_split(self, Dataset, train: bool) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the raw uint8 `[N, H, W, C]` images and int64 labels of a split.
+
+        The first call decodes the torchvision pickles and writes the split once as `.npy` files
+        under `dataset_path`. Later calls memory-map those files, which skips the pickle decoding
+        and lets every process on the node share the OS page cache.
+        """
+        split = "train" if train else "test"
+        images_path = os.path.join(
+            self.dataset_path, f"{self.dataset_name}_{split}_images.npy"
+        )
+        labels_path = os.path.join(
+            self.dataset_path, f"{self.dataset_name}_{split}_labels.npy"
+        )
+        if os.path.isfile(images_path) and os.path.isfile(labels_path):
+            return np.load(images_path, mmap_mode="r"), np.load(labels_path)
+
+        dataset = Dataset(
+            root=self.dataset_path, train=train, download=self.should_download()
+        )
+        images = dataset.data
+        labels = np.asarray(dataset.targets, dtype=np.int64)
+
+        # Same single-writer, atomic-swap scheme as the statistics cache
+        if is_local_primary():
+            for path, array in ((images_path, images), (labels_path, labels)):
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    np.save(f, array)
+                os.replace(tmp_path, path)
+            self.logger.debug(f"Saved raw {split} split to '{self.dataset_path}'.")
+
+        return images, labels
+
+    def load_or_compute_stats(
+        self, train_images: Optional[np.ndarray] = None
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Load the per-channel mean and std of the training split cached under `dataset_path`,
+        computing and caching them on first use.
+
+        Pass the raw training images when they are already loaded, so a cache miss does not
+        load the split a second time.
+        """
+        stats_path = os.path.join(
+            self.dataset_path, f"{self.dataset_name}_train_stats.json"
+        )
+        if os.path.isfile(stats_path):
+            with open(stats_path, "r") as f:
+                stats = json.load(f)
+            self.logger.debug(f"Loaded dataset statistics from '{stats_path}'.")
+            return stats["mean"], stats["std"]
+
+        if train_images is None:
+            train_images, _ = self.load_raw_split(self.get_dataset_class(), train=True)
+
+        # Reduce over the raw uint8 array directly, no DataLoader pass needed
+        mean, std = calculate_mean_std_from_data(train_images)
+
+        # Only one process per node writes the cache, and the file is swapped in atomically
+        # so that other processes never read a partial file.
+        if is_local_primary():
+            tmp_path = f"{stats_path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"mean": mean, "std": std}, f)
+            os.replace(tmp_path, stats_path)
+            self.logger.debug(f"Saved dataset statistics to '{stats_path}'.")
+
+        return mean, std
+
     def get_dataset(
         self,
         train_ratio: float,
         transform: Optional[Tuple[transforms.Compose, transforms.Compose]] = None,
+        seed: Optional[int] = 0,
     ):
         """
         Retrieve datasets for training, validation, and testing based on whether fake data or real data is used.
+
+        The train/validation split is a permutation drawn from `seed` (0 when `seed` is None), so
+        every process gets the same split. The validation split uses the test transform
+        (`transform[1]`).
+
+        Real datasets are preloaded into RAM as uint8 tensors, so a user-supplied `transform`
+        must operate on uint8 `[C, H, W]` tensors rather than PIL images.
         """
         if self.use_fake_data:
             num_classes = {"cifar100": 100, "cifar10": 10}.get(self.dataset_name)
@@ -108,74 +515,49 @@ class DataLoaderManager:
             )
 
         else:
-            dataset_classes = {
-                "cifar10": datasets.CIFAR10,
-                "cifar100": datasets.CIFAR100,
-            }
-            Dataset = dataset_classes[self.dataset_name]
-            Dataset.download = suppress_print(Dataset.download)
+            Dataset = self.get_dataset_class()
+
+            # Load the training split once, it serves both the statistics and the split
+            train_images, train_targets = self.load_raw_split(Dataset, train=True)
 
             # Define default transformations if none provided
             if transform is None:
-                temp_dataset = Dataset(
-                    root=self.dataset_path,
-                    train=True,
-                    download=self.download,
-                    transform=transforms.ToTensor(),
-                )
-                data_loader = DataLoader(
-                    dataset=temp_dataset,
-                    batch_size=256,
-                    shuffle=False,
-                    num_workers=0,
-                )
-
-                mean, std = calculate_mean_std(data_loader)
-                normalize = transforms.Normalize(mean=mean, std=std)
-
-                del temp_dataset, data_loader
+                mean, std = self.load_or_compute_stats(train_images)
+                # uint8 -> normalized float32 in a single lookup
+                normalize = NormalizeLUT(mean=mean, std=std)
 
                 train_transform = transforms.Compose(
                     transforms=[
                         transforms.RandomCrop(32, padding=4),
                         transforms.RandomHorizontalFlip(),
                         transforms.RandomRotation(15),
-                        transforms.ToTensor(),
-                        normalize,
-                    ]
-                )
-                test_transform = transforms.Compose(
-                    [
-                        transforms.ToTensor(),
                         normalize,
                     ]
                 )
+                test_transform = transforms.Compose([normalize])
                 transform = (train_transform, test_transform)
 
             assert len(transform) == 2, "Transform should be a tuple of two transforms."
 
             # Split the real dataset into training and validation sets
-            full_dataset = Dataset(
-                root=self.dataset_path,
-                train=True,
-                download=self.download,
-                transform=transform[0],
-            )
+            full_dataset = InMemoryCIFAR(train_images, train_targets)
 
             total_size = len(full_dataset)
             train_size = int(total_size * train_ratio)
-            val_size = total_size - train_size
 
-            train_dataset, val_dataset = random_split(
-                dataset=full_dataset, lengths=[train_size, val_size]
+            # An unseeded split would differ per rank and leak validation samples into training
+            split_seed = 0 if seed is None else seed
+            indices = np.random.default_rng(split_seed).permutation(total_size)
+            train_dataset = TransformedSubset(
+                full_dataset, indices[:train_size], transform=transform[0]
+            )
+            val_dataset = TransformedSubset(
+                full_dataset, indices[train_size:], transform=transform[1]
             )
 
             # Create the test dataset
-            test_dataset = Dataset(
-                root=self.dataset_path,
-                train=False,
-                download=self.download,
-                transform=transform[1],
+            test_dataset = InMemoryCIFAR(
+                *self.load_raw_split(Dataset, train=False), transform=transform[1]
             )
         # wrong when calling verify_and_download_dataset
         # self.logger.debug(
@@ -191,11 +573,15 @@ class DataLoaderManager:
         train_ratio: float,
         distributed: bool = False,
         transform: Optional[Tuple[transforms.Compose, transforms.Compose]] = None,
+        device: Optional[torch.device] = None,
+        seed: Optional[int] = 0,
+        dtype: torch.dtype = torch.float32,
+        memory_format: torch.memory_format = torch.contiguous_format,
     ) -> Tuple[
-        DataLoader,
-        DataLoader,
-        DataLoader,
-        Optional[DistributedSampler],
+        Union[NPUPrefetcher, DataLoader],
+        Union[NPUPrefetcher, DataLoader],
+        Union[NPUPrefetcher, DataLoader],
+        Optional[ShardShuffleSampler],
         Optional[DistributedSampler],
         Optional[DistributedSampler],
     ]:
@@ -210,10 +596,30 @@ class DataLoaderManager:
         - When `distributed=True` and a `DistributedSampler` is provided, the DataLoader uses `DistributedSampler`:
         - Ensures each process gets a unique subset of the data.
 
+        - When `distributed=True`, the training set is instead sharded up front: each rank gets an equally
+          sized, fixed slice of the split and a `ShardShuffleSampler` that reshuffles it on `set_epoch`.
+
+        When `device` is given, the loaders are wrapped in `NPUPrefetcher`, which copies the next
+        batch to that device while the current one is being consumed and hands it over as `dtype`
+        in `memory_format`. For real data without a user-supplied `transform`, the workers then only
+        ship raw uint8 images and augmentation/normalization run batched on the device.
+
+        With `num_workers > 0` the worker processes are persistent and prefetch 4 batches each;
+        `num_workers=0` loads in the main process and disables both.
+
         This function returns data loaders for training, validation, and testing datasets with appropriate samplers.
         """
+        batch_transforms = (None, None)
+        if device is not None and transform is None and not self.use_fake_data:
+            mean, std = self.load_or_compute_stats()
+            transform = (None, None)
+            batch_transforms = (
+                DeviceBatchTransform(mean, std, augment=True).to(device),
+                DeviceBatchTransform(mean, std).to(device),
+            )
+
         train_dataset, val_dataset, test_dataset = self.get_dataset(
-            train_ratio, transform
+            train_ratio, transform, seed
         )
 
         if distributed:
@@ -221,11 +627,14 @@ class DataLoaderManager:
                 raise RuntimeError(
                     "Distributed mode is enabled, but the torch.distributed backend is not initialized."
                 )
-            train_sampler = DistributedSampler(
-                train_dataset,
-                num_replicas=dist.get_world_size(),
-                rank=dist.get_rank(),
-                shuffle=True,
+            # The train split is already a seeded permutation, so each rank keeps a fixed
+            # slice of it and only reshuffles within that slice every epoch
+            train_dataset = shard_dataset(
+                train_dataset, rank=dist.get_rank(), world_size=dist.get_world_size()
+            )
+            # A null `training.seed` still needs an integer base for the per-epoch reshuffle
+            train_sampler = ShardShuffleSampler(
+                len(train_dataset), seed=0 if seed is None else seed
             )
             val_sampler = DistributedSampler(
                 val_dataset,
@@ -243,20 +652,35 @@ class DataLoaderManager:
         else:
             train_sampler, val_sampler, test_sampler = (None, None, None)
 
+        # Page-locked batches are required for the asynchronous copies of `NPUPrefetcher`
+        loader_kwargs = {
+            "num_workers": num_workers,
+            "pin_memory": device is not None and device.type != "cpu",
+        }
+        # Without `pin_memory_device`, DataLoader only pins when CUDA is available
+        if loader_kwargs["pin_memory"] and device.type != "cuda":
+            loader_kwargs["pin_memory_device"] = device.type
+        # Keep worker processes alive across epochs and let each one prefetch ahead.
+        # Both options require worker processes, so `num_workers=0` disables them.
+        if num_workers > 0:
+            loader_kwargs.update(persistent_workers=True, prefetch_factor=4)
+
         train_loader = DataLoader(
             dataset=train_dataset,
             batch_size=adjusted_batch_size,
             shuffle=(train_sampler is None),
             sampler=train_sampler,
-            num_workers=num_workers,
+            **loader_kwargs,
             drop_last=True,
         )
+        # Evaluation loaders are sharded by their DistributedSampler too, so they use the
+        # per-rank batch size like the training loader
         val_loader = DataLoader(
             dataset=val_dataset,
-            batch_size=batch_size,
+            batch_size=adjusted_batch_size,
             shuffle=False,
             sampler=val_sampler,
-            num_workers=num_workers,
+            **loader_kwargs,
             drop_last=False,
         )
         test_loader = DataLoader(
@@ -264,10 +688,22 @@ class DataLoaderManager:
             batch_size=adjusted_batch_size,
             shuffle=False,
             sampler=test_sampler,
-            num_workers=num_workers,
+            **loader_kwargs,
             drop_last=False,
         )
 
+        if device is not None:
+            prefetch_kwargs = {"dtype": dtype, "memory_format": memory_format}
+            train_loader = NPUPrefetcher(
+                train_loader, device, batch_transforms[0], **prefetch_kwargs
+            )
+            val_loader = NPUPrefetcher(
+                val_loader, device, batch_transforms[1], **prefetch_kwargs
+            )
+            test_loader = NPUPrefetcher(
+                test_loader, device, batch_transforms[1], **prefetch_kwargs
+            )
+
         return (
             train_loader,
             val_loader,
@@ -315,7 +751,7 @@ if __name__ == "__main__":
         [
             transforms.RandomHorizontalFlip(),
             transforms.RandomCrop(32, padding=4),
-            transforms.ToTensor(),
+            transforms.ConvertImageDtype(torch.float32),
             transforms.Normalize(
                 mean=[0.5071, 0.4867, 0.4408], std=[0.2675, 0.2565, 0.2761]
             ),
@@ -323,7 +759,7 @@ if __name__ == "__main__":
     )
     test_transform_real = transforms.Compose(
         [
-            transforms.ToTensor(),
+            transforms.ConvertImageDtype(torch.float32),
             transforms.Normalize(
                 mean=[0.5071, 0.4867, 0.4408], std=[0.2675, 0.2565, 0.2761]
             ),
@@ -31,7 +31,9 @@ def initialize_distributed_environment(backend="hccl", init_method="env://"):
     if dist.get_rank() == 0:
         print(f"Distributed Environment initialized with backend {backend}.")
     print(f"Rank {rank}/{world_size} reporting for duty.")
-    torch.npu.set_device(rank)
+    # Bind this process to its NPU once, before any model or tensor is created.
+    # The local rank (not the global one) indexes the devices of this node.
+    torch.npu.set_device(int(os.getenv("LOCAL_RANK", rank)))
 
 
 # Initialize the distributed environment before importing self-defined packages
@@ -187,32 +189,35 @@ class MainManager:
                 print("Seed is not set. Training will not be deterministic.")
 
     def verify_and_download_data(self):
-        """Perform dataset verification and downloading on master node only."""
-        from data_loader_class import DataLoaderManager
-
-        if self.rank == 0:
-            # dataset_path = self.config["data"]["path"]
+        """
+        Perform dataset verification and downloading on local rank 0 of every node, since
+        `data.path` may be local to each node. Other ranks wait for it at the barrier in
+        `run_training`.
+        """
+        from data_loader_class import DataLoaderManager, is_local_primary
+
+        if is_local_primary():
+            # Only rank 0 has the main logger; other nodes' local rank 0 log nowhere
+            logger = (
+                self.main_logger
+                if self.main_logger is not None
+                else logging.getLogger("MainProcess")
+            )
+            # Must be the path the workers read from, other ranks never download
+            dataset_path = self.config["data"]["path"]
             dataset_name = self.config["data"]["dataset_name"]
-            if dataset_name == "cifar10":
-                dataset_path = (
-                    "/data/Pein/Pytorch/Ascend-NPU-Parallel-Training/cifar100_data"
-                )
-            elif dataset_name == "cifar100":
-                dataset_path = (
-                    "/data/Pein/Pytorch/Ascend-NPU-Parallel-Training/cifar100_data"
-                )
-            else:
+            if dataset_name not in ["cifar10", "cifar100"]:
                 raise ValueError(f"dataset_name: {dataset_name} is not supported.")
 
             data_loader_manager = DataLoaderManager(
                 dataset_name=dataset_name,
                 dataset_path=dataset_path,
-                logger=self.main_logger,
+                logger=logger,
                 use_fake_data=self.config["data"]["use_dummy"],
             )
             data_loader_manager.verify_and_download_dataset()
             del data_loader_manager
-            self.main_logger.info("Dataset verified and downloaded successfully.")
+            logger.info("Dataset verified and downloaded successfully.")
         else:
             pass
 
@@ -223,7 +228,8 @@ class MainManager:
             pass
             # self.main_logger.info("Attempting to synchronize all processes...")
 
-        # Synchronize all processes at the start
+        # Synchronize all processes at the start, this also keeps the other ranks from
+        # reading the dataset before their node's local rank 0 has downloaded and cached it
         dist.barrier()
 
         if self.rank == 0:
@@ -340,7 +346,8 @@ def main(default_yaml_path: str, experiment_yaml_path: str):
 
     if dist.get_rank() == 0:
         main_manager.setup_main_logger()
-        main_manager.verify_and_download_data()
+    # Runs on every process; only local rank 0 of each node actually downloads
+    main_manager.verify_and_download_data()
 
     main_manager.run_training()
 
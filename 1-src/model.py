@@ -1,5 +1,7 @@
 import logging
-from typing import Callable, Dict
+import os
+from typing import Callable, Dict, Tuple
+from urllib.parse import urlparse
 
 import torch
 import torch.distributed as dist
@@ -24,40 +26,92 @@ else:
     )
 
 
+def _load_pretrained_state_dict(arch: str) -> Dict[str, torch.Tensor]:
+    """
+    Download the ImageNet checkpoint of `arch` into the torch hub cache once per node (local
+    rank 0), then memory-map it on every rank instead of each rank fetching its own copy.
+    """
+    # IMAGENET1K_V1 is what the legacy `pretrained=True` flag resolves to; DEFAULT may be V2
+    url = models.get_model_weights(arch).IMAGENET1K_V1.url
+    checkpoint_path = os.path.join(
+        torch.hub.get_dir(), "checkpoints", os.path.basename(urlparse(url).path)
+    )
+    if int(os.getenv("LOCAL_RANK", "0")) == 0 and not os.path.isfile(checkpoint_path):
+        os.makedirs(os.path.dirname(checkpoint_path), exist_ok=True)
+        torch.hub.download_url_to_file(url, checkpoint_path, progress=False)
+        if model_logger is not None:
+            model_logger.debug(f"Downloaded pretrained weights to {checkpoint_path}")
+    dist.barrier()
+
+    return torch.load(checkpoint_path, map_location="cpu", mmap=True, weights_only=True)
+
+
+def _load_pretrained_body(model: nn.Module, arch: str, skip_prefixes: Tuple[str, ...]):
+    """Load the ImageNet weights of `arch` into `model`, except the replaced layers."""
+    state_dict = _load_pretrained_state_dict(arch)
+    body_state_dict = {
+        k: v for k, v in state_dict.items() if not k.startswith(skip_prefixes)
+    }
+    model.load_state_dict(body_state_dict, strict=False)
+
+
+def _build_resnet(arch: str, num_classes: int, pretrained: bool) -> nn.Module:
+    """Build a torchvision ResNet with a CIFAR stem (3x3 conv, no max pooling) and head."""
+    # The stem and head are replaced below, so pretrained weights are only loaded for the body
+    model = models.__dict__[arch](pretrained=False)
+    model.conv1 = nn.Conv2d(3, 64, kernel_size=3, stride=1, padding=1, bias=False)
+    model.maxpool = nn.Identity()
+    model.fc = nn.Linear(model.fc.in_features, num_classes)
+
+    if pretrained:
+        _load_pretrained_body(model, arch, skip_prefixes=("conv1.", "fc."))
+    return model
+
+
+def _build_classifier_model(arch: str, num_classes: int, pretrained: bool) -> nn.Module:
+    """Build a torchvision model whose head is `classifier[-1]` (MobileNet, VGG)."""
+    model = models.__dict__[arch](pretrained=pretrained)
+    model.classifier[-1] = nn.Linear(model.classifier[-1].in_features, num_classes)
+    return model
+
+
+# Per-architecture builders returning a model with its stem/head already adapted to CIFAR
+_ARCH_BUILDERS: Dict[str, Callable[[str, int, bool], nn.Module]] = {
+    "resnet18": _build_resnet,
+    "resnet34": _build_resnet,
+    "resnet50": _build_resnet,
+    "resnet101": _build_resnet,
+    "resnet152": _build_resnet,
+    "resnext50_32x4d": _build_resnet,
+    "resnext101_32x8d": _build_resnet,
+    "resnext101_64x4d": _build_resnet,
+    "wide_resnet50_2": _build_resnet,
+    "wide_resnet101_2": _build_resnet,
+    "mobilenet_v2": _build_classifier_model,
+    "mobilenet_v3_small": _build_classifier_model,
+    "mobilenet_v3_large": _build_classifier_model,
+    "vgg16": _build_classifier_model,
+    "vgg16_bn": _build_classifier_model,
+}
+
+
 class CIFARNet(nn.Module):
     def __init__(
         self,
-        num_classes,
-        model_func: Callable,
-        pretrained: bool = False,
+        model: nn.Module,
+        num_classes: int,
         device: torch.device = torch.device("cpu"),
+        channels_last: bool = False,
+        dtype: torch.dtype = torch.float32,
     ):
         super(CIFARNet, self).__init__()
-        self.model = model_func(pretrained=pretrained)
+        self.model = model
         self.num_classes = num_classes
         self.device = device
-
-        # Modify the first convolution layer and remove max pooling for ResNet
-        if isinstance(self.model, models.ResNet):
-            self.model.conv1 = nn.Conv2d(
-                3, 64, kernel_size=3, stride=1, padding=1, bias=False
-            )
-            self.model.maxpool = nn.Identity()
-
-        # Replace the final layer to adapt to CIFAR-10/100 class numbers
-        final_layer = (
-            self.model.fc if hasattr(self.model, "fc") else self.model.classifier[-1]
+        self.memory_format = (
+            torch.channels_last if channels_last else torch.contiguous_format
         )
-        num_features = final_layer.in_features
-        new_final_layer = nn.Linear(num_features, num_classes)
-        if hasattr(self.model, "fc"):
-            self.model.fc = new_final_layer
-        elif hasattr(self.model, "classifier"):
-            self.model.classifier[-1] = new_final_layer
-        else:
-            raise NotImplementedError(
-                "Model must have a 'fc' or 'classifier[-1]' attribute."
-            )
+        self.dtype = dtype
 
         if model_logger is not None:
             model_logger.debug("CIFARNet adjusted for CIFAR-10/100 dataset")
@@ -70,7 +124,12 @@ class CIFARNet(nn.Module):
             raise ValueError(
                 "Device is not set! Please set device before calling to_device()"
             )
-        self.to(self.device)
+        self.to(
+            self.device,
+            dtype=self.dtype,
+            memory_format=self.memory_format,
+            non_blocking=True,
+        )
 
     def unfreeze(self) -> None:
         """Unfreeze all model parameters for training."""
@@ -87,23 +146,45 @@ def load_or_create_model(config: Dict, device: torch.device = None) -> CIFARNet:
         arch = config["model"]["arch"]
         dataset_name = config["data"].get("dataset_name", "cifar100")
         pretrained = config["model"].get("pretrained", False)
+        compile_model = config["model"].get("compile", False)
+        channels_last = config["model"].get("channels_last", False)
+        dtype = torch.bfloat16 if config["model"].get("bf16", False) else torch.float32
         if not device:
             device_str = config["distributed_training"].get("device", "cpu")
             device = torch.device(device_str)
-
-        model_func = models.__dict__[arch]
-        num_classes = 100 if dataset_name == "cifar100" else 10
-
-        model = CIFARNet(
-            model_func=model_func,
-            num_classes=num_classes,
-            pretrained=pretrained,
-            device=device,
-        )
-        return model
     except KeyError as e:
         raise ValueError(f"Missing configuration for {e.args[0]}")
 
+    builder = _ARCH_BUILDERS.get(arch)
+    if builder is None:
+        supported_archs = ", ".join(_ARCH_BUILDERS.keys())
+        raise ValueError(
+            f"Unsupported architecture: {arch}. Supported architectures are: {supported_archs}"
+        )
+
+    num_classes = 100 if dataset_name == "cifar100" else 10
+
+    model = CIFARNet(
+        model=builder(arch, num_classes, pretrained),
+        num_classes=num_classes,
+        device=device,
+        channels_last=channels_last,
+        dtype=dtype,
+    )
+
+    if compile_model:
+        # Both paths keep the state_dict keys free of the `_orig_mod.` prefix
+        if hasattr(model, "compile"):
+            # In-place compilation, torch >= 2.2
+            model.compile()
+        else:
+            # Older torch: compile the wrapped network's forward instead of the module
+            model.model.forward = torch.compile(model.model.forward)
+        if model_logger is not None:
+            model_logger.debug(f"Model {arch} compiled with torch.compile")
+
+    return model
+
 
 if __name__ == "__main__":
     # Define configuration for the model
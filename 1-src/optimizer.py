@@ -1,11 +1,17 @@
+import contextlib
 import logging
-from typing import Any, Dict, Optional, Type
+from typing import Any, Callable, ContextManager, Dict, Optional, Tuple, Type
 
 import torch
 import torch.distributed as dist
 import torch.nn as nn
 import torch.optim as optim
 from setup_utilis import setup_logger
+from torch.distributed.algorithms.ddp_comm_hooks import default_hooks, powerSGD_hook
+from torch.distributed.algorithms.model_averaging.averagers import (
+    PeriodicModelAverager,
+)
+from torch.nn.parallel import DistributedDataParallel as DDP
 from torch.optim.lr_scheduler import (
     CosineAnnealingLR,
     OneCycleLR,
@@ -14,7 +20,6 @@ from torch.optim.lr_scheduler import (
     _LRScheduler,
 )
 
-optimizer_logger = None
 if dist.is_initialized():
     if dist.get_rank() == 0:
         optimizer_logger = setup_logger(
@@ -24,38 +29,129 @@ if dist.is_initialized():
             console=False,
         )
         optimizer_logger.debug("Optimizer process logger initialized.")
+    else:
+        # Disabled logger on other ranks, so call sites need no rank checks
+        optimizer_logger = logging.getLogger("OptimizerProcess")
+        optimizer_logger.addHandler(logging.NullHandler())
+        optimizer_logger.propagate = False
+        optimizer_logger.disabled = True
 else:
     raise ValueError(
         "Distributed training is not initialized. Rasied error from optimizer.py"
     )
 
 
+def _build_sgd(parameters, lr, momentum=0.0, weight_decay=0.0, **_):
+    return optim.SGD(parameters, lr=lr, momentum=momentum, weight_decay=weight_decay)
+
+
+def _adam_builder(
+    optimizer_cls: Type[optim.Optimizer],
+) -> Callable[..., optim.Optimizer]:
+    def build(parameters, lr, betas=(0.9, 0.999), weight_decay=0.0, **_):
+        return optimizer_cls(parameters, lr=lr, betas=betas, weight_decay=weight_decay)
+
+    return build
+
+
+def _bnb_8bit_builder(name: str) -> Callable[..., optim.Optimizer]:
+    def build(parameters, lr, betas=(0.9, 0.999), weight_decay=0.0, **_):
+        # bitsandbytes is optional and its 8-bit kernels only run on CUDA devices
+        try:
+            import bitsandbytes as bnb
+        except ImportError as e:
+            raise ImportError(
+                f"Optimizer {name} requires the bitsandbytes package (CUDA only)."
+            ) from e
+        # Block-wise quantized states, paged so they can spill to host memory
+        return getattr(bnb.optim, name)(
+            parameters,
+            lr=lr,
+            betas=betas,
+            weight_decay=weight_decay,
+            block_wise=True,
+            is_paged=True,
+        )
+
+    return build
+
+
+_ADAM_KWARGS = ("lr", "betas", "weight_decay")
+
+# Builders for the known optimizers, each with the config arguments it accepts; a
+# builder ignores any other argument
+_BUILDERS: Dict[str, Tuple[Callable[..., optim.Optimizer], Tuple[str, ...]]] = {
+    "SGD": (_build_sgd, ("lr", "momentum", "weight_decay")),
+    "Adam": (_adam_builder(optim.Adam), _ADAM_KWARGS),
+    "AdamW": (_adam_builder(optim.AdamW), _ADAM_KWARGS),
+    "Adam8bit": (_bnb_8bit_builder("Adam8bit"), _ADAM_KWARGS),
+    "AdamW8bit": (_bnb_8bit_builder("AdamW8bit"), _ADAM_KWARGS),
+}
+
+
 def initialize_optimizer_manager(model: nn.Module, config: Dict):
-    # Extract optimizer parameters from the config
-    optimizer_params = {
-        "lr": float(config["training"]["lr"]),
-        "momentum": float(config["optimizer"].get("momentum", 0.9)),
-        "weight_decay": float(config["optimizer"]["weight_decay"]),
-        "betas": tuple(float(x) for x in config["optimizer"].get("betas", [0.9, 0.95])),
+    # Optionally keep Adam/AdamW states in block-wise 8-bit via bitsandbytes; each maps
+    # to its own 8-bit variant so L2 and decoupled weight decay are not swapped
+    optimizer_type = config["optimizer"]["name"]
+    if config["optimizer"].get("quantize_states", False) and optimizer_type in [
+        "Adam",
+        "AdamW",
+    ]:
+        optimizer_type = f"{optimizer_type}8bit"
+
+    # Extract only the optimizer parameters the selected optimizer accepts
+    param_parsers = {
+        "lr": lambda: float(config["training"]["lr"]),
+        "momentum": lambda: float(config["optimizer"].get("momentum", 0.9)),
+        "weight_decay": lambda: float(config["optimizer"]["weight_decay"]),
+        "betas": lambda: tuple(
+            float(x) for x in config["optimizer"].get("betas", [0.9, 0.95])
+        ),
     }
-
-    # Additional parameters for optimizers that require them
-    if "momentum" in config["optimizer"]:
-        optimizer_params["momentum"] = float(config["optimizer"]["momentum"])
-    if "betas" in config["optimizer"]:
-        optimizer_params["betas"] = tuple(
-            float(x) for x in config["optimizer"]["betas"]
+    # Optimizers without a builder receive every argument
+    builder_entry = _BUILDERS.get(optimizer_type)
+    supported_kwargs = builder_entry[1] if builder_entry is not None else param_parsers
+    optimizer_params = {k: param_parsers[k]() for k in supported_kwargs}
+
+    # Native mixed precision: autocast in the training loop, loss scaling for float16
+    amp_config = config.get("amp", {})
+    use_amp = bool(amp_config.get("autocast", False))
+    if use_amp and amp_config.get("amp_enabled", False):
+        raise ValueError(
+            "amp.autocast and amp.amp_enabled (apex) cannot be enabled together."
+        )
+    amp_dtype_name = amp_config.get("autocast_dtype", "bfloat16")
+    if amp_dtype_name not in ["float16", "bfloat16"]:
+        raise ValueError(
+            f"Unsupported autocast dtype: {amp_dtype_name}. Supported types are: float16, bfloat16"
         )
 
     # Initialize the OptimizerManager with extracted parameters
     optimizer_manager = OptimizerManager(
         model.parameters(),
-        optimizer_type=config["optimizer"]["name"],
+        optimizer_type=optimizer_type,
         optimizer_params=optimizer_params,
         patience=int(config["early_stopping"]["patience"]),
         min_loss_improvement=float(config["early_stopping"]["min_loss_improvement"]),
+        accumulation_steps=int(config["training"].get("accum_steps", 1)),
+        use_amp=use_amp,
+        amp_dtype=getattr(torch, amp_dtype_name),
     )
 
+    # Optionally compress gradients during the DDP all-reduce
+    comm_hook = config["optimizer"].get("comm_hook")
+    if comm_hook and isinstance(model, DDP):
+        optimizer_manager.register_comm_hook(model, comm_hook)
+
+    # Optionally replace per-step gradient all-reduce with periodic parameter averaging
+    local_sgd_period = int(config["optimizer"].get("local_sgd_period", 0))
+    if local_sgd_period > 0 and isinstance(model, DDP):
+        optimizer_manager.enable_local_sgd(
+            period=local_sgd_period,
+            warmup_steps=int(config["optimizer"].get("local_sgd_warmup_steps", 0)),
+            model=model,
+        )
+
     return optimizer_manager
 
 
@@ -71,22 +167,48 @@ class OptimizerManager:
         optimizer_params: Dict[str, Any],
         patience: int = 10,
         min_loss_improvement: float = 1e-6,
+        accumulation_steps: int = 1,
+        use_amp: bool = False,
+        amp_dtype: torch.dtype = torch.bfloat16,
     ):
         """
         Initialize the OptimizerManager with the specified optimizer type and parameters.
         """
-        self.model_parameters = model_parameters
+        # Materialize so the parameters can be handed to a rebuilt optimizer later
+        self.model_parameters = list(model_parameters)
         self.optimizer_params = optimizer_params
         self.optimizer = self.create_optimizer(
-            model_parameters, optimizer_type, optimizer_params
+            self.model_parameters, optimizer_type, optimizer_params
         )
         self.scheduler = None  # Placeholder for a learning rate scheduler
         self.patience = patience
         self.min_loss_improvement = min_loss_improvement
         self.best_loss = float("inf")
+        # Loss a validation result must beat to count as an improvement
+        self._best_threshold = self.best_loss - self.min_loss_improvement
         self.early_stop_counter = 0
 
         self.early_stop = False
+        self.comm_hook_state = None
+        self.accumulation_steps = max(1, accumulation_steps)
+        self.model_averager = None
+        self._averaged_model = None
+
+        # bfloat16 has float32's range, so only float16 needs a gradient scaler
+        self.autocast_dtype = amp_dtype if use_amp else None
+        self.scaler = None
+        if use_amp:
+            device_type = self.model_parameters[0].device.type
+            self.scaler = getattr(torch, device_type).amp.GradScaler(
+                enabled=amp_dtype == torch.float16
+            )
+
+        # Pinned host buffers, side stream and completion event used to upload restored
+        # optimizer state
+        self._pinned_cache: Dict[str, torch.Tensor] = {}
+        self._h2d_stream = None
+        self._h2d_done = None
+        self._h2d_pending = False
 
     def create_optimizer(
         self, parameters, optimizer_type: str, optimizer_params: Dict[str, Any]
@@ -94,47 +216,66 @@ class OptimizerManager:
         """
         Factory method to create an optimizer based on the type and parameters specified.
         """
+        builder_entry = _BUILDERS.get(optimizer_type)
+        if builder_entry is not None:
+            builder, _ = builder_entry
+            return builder(parameters, **optimizer_params)
+
+        # Other torch.optim optimizers receive every provided argument
         optimizer_cls = getattr(optim, optimizer_type, None)
         if optimizer_cls is None:
             raise ValueError(f"Unsupported optimizer type: {optimizer_type}")
+        return optimizer_cls(parameters, **optimizer_params)
 
-        # Prepare parameters specific to each optimizer to avoid passing unsupported arguments
-        if optimizer_type in ["Adam", "AdamW"]:
-            # Adam and AdamW do not use 'momentum'
-            filtered_params = {
-                k: v for k, v in optimizer_params.items() if k != "momentum"
-            }
-        elif optimizer_type == "SGD":
-            # SGD uses 'momentum' but not 'betas'
-            filtered_params = {
-                k: v for k, v in optimizer_params.items() if k != "betas"
-            }
-        else:
-            # For other optimizers, use all provided parameters
-            filtered_params = optimizer_params
-
-        return optimizer_cls(parameters, **filtered_params)
+    def state_dict(self) -> Dict[str, Any]:
+        """
+        Return the optimizer state dictionary, tagged with the optimizer class under
+        "__cls__" so `update_optimizer_state` can tell whether it must rebuild, and with
+        the float16 loss scaler state under "__scaler__" when loss scaling is active.
+        """
+        state_dict = self.optimizer.state_dict()
+        state_dict["__cls__"] = self.optimizer.__class__.__name__
+        if self.scaler is not None and self.scaler.is_enabled():
+            state_dict["__scaler__"] = self.scaler.state_dict()
+        return state_dict
 
     def update_optimizer_state(self, optimizer_state_dict, params_to_restore=None):
         """
         Update specific states of the optimizer from a state dictionary, while reinitializing others.
+
+        The optimizer is only rebuilt when the state dictionary records (under "__cls__")
+        a different optimizer class; otherwise the state is loaded in place, avoiding a
+        second full set of state tensors.
         """
-        if optimizer_logger is not None:
-            optimizer_logger.debug("Updating optimizer state...")
+        optimizer_logger.debug("Updating optimizer state...")
 
         if params_to_restore is None:
             params_to_restore = []
 
-        # Reinitialize the optimizer to reset all internal states
-        self.optimizer = self.create_optimizer(
-            self.model_parameters,
-            self.optimizer.__class__.__name__,
-            self.optimizer_params,
-        )
+        current_cls = self.optimizer.__class__.__name__
+        saved_cls = optimizer_state_dict.get("__cls__", current_cls)
+        if saved_cls != current_cls:
+            self.optimizer = self.create_optimizer(
+                self.model_parameters, saved_cls, self.optimizer_params
+            )
+            optimizer_logger.debug(
+                f"Rebuilt optimizer as {saved_cls} (was {current_cls})."
+            )
 
-        # Restore the optimizer state
+        # Upload CPU state asynchronously; load_state_dict then finds it already in place
+        optimizer_state_dict = self._stage_state_to_device(optimizer_state_dict)
         self.optimizer.load_state_dict(optimizer_state_dict)
 
+        # Resume from the saved loss scale instead of re-growing it from the default
+        scaler_state_dict = optimizer_state_dict.get("__scaler__")
+        if (
+            scaler_state_dict is not None
+            and self.scaler is not None
+            and self.scaler.is_enabled()
+        ):
+            self.scaler.load_state_dict(scaler_state_dict)
+            optimizer_logger.debug("Restored loss scaler state.")
+
         # Optionally restore specific parameters if needed
         if params_to_restore:
             for group in self.optimizer.param_groups:
@@ -144,17 +285,229 @@ class OptimizerManager:
                         param_name, "Undefined"
                     )
                     group[param_name] = restored_value
-                    if optimizer_logger is not None:
-                        optimizer_logger.debug(
-                            f"Restored {param_name} from {original_value} to {restored_value}"
+                    optimizer_logger.debug(
+                        f"Restored {param_name} from {original_value} to {restored_value}"
+                    )
+
+    def _stage_state_to_device(self, optimizer_state_dict: Dict) -> Dict:
+        """
+        Copy CPU optimizer state to the parameters' device through pinned buffers on a
+        side stream, so restoring a checkpoint does not block the compute stream. The
+        compute stream only waits for the copies at the next `step()`, and the buffers
+        are released once the copies have completed.
+
+        Args:
+            optimizer_state_dict (Dict): Optimizer state dictionary, typically loaded on CPU.
+
+        Returns:
+            Dict: A shallow copy of the state dictionary with staged device tensors.
+        """
+        device = self.model_parameters[0].device
+        if device.type == "cpu":
+            return optimizer_state_dict
+
+        # Map saved parameter ids to the live parameters, as load_state_dict does
+        params_by_id = {
+            param_id: param
+            for saved_group, group in zip(
+                optimizer_state_dict["param_groups"], self.optimizer.param_groups
+            )
+            for param_id, param in zip(saved_group["params"], group["params"])
+        }
+
+        device_module = getattr(torch, device.type)
+        if self._h2d_stream is None:
+            self._h2d_stream = device_module.Stream(device=device)
+        # Buffers of a previous restore may still be read by its copies
+        self._release_pinned_buffers(wait=True)
+
+        staged_state = {}
+        with device_module.stream(self._h2d_stream):
+            for param_id, param_state in optimizer_state_dict["state"].items():
+                param = params_by_id.get(param_id)
+                staged = {}
+                for key, value in param_state.items():
+                    # Scalar entries such as Adam's 'step' are kept on CPU by the optimizer
+                    if (
+                        param is not None
+                        and torch.is_tensor(value)
+                        and value.device.type == "cpu"
+                        and value.dim() > 0
+                    ):
+                        pinned = torch.empty(
+                            value.shape, dtype=value.dtype, pin_memory=True
                         )
+                        pinned.copy_(value)
+                        # Kept alive until the asynchronous copy reading it has finished
+                        self._pinned_cache[f"{param_id}.{key}"] = pinned
+                        dtype = param.dtype if value.is_floating_point() else value.dtype
+                        value = pinned.to(param.device, dtype=dtype, non_blocking=True)
+                    staged[key] = value
+                staged_state[param_id] = staged
+
+            self._h2d_done = device_module.Event()
+            self._h2d_done.record(self._h2d_stream)
+
+        self._h2d_pending = True
+        return {**optimizer_state_dict, "state": staged_state}
+
+    def _wait_for_staged_state(self) -> None:
+        """
+        Make the compute stream wait for the optimizer state uploaded by
+        `_stage_state_to_device` and hand the uploaded tensors over to it. Only the
+        device waits; the host keeps queueing work.
+        """
+        device = self._h2d_stream.device
+        current_stream = getattr(torch, device.type).current_stream(device)
+        current_stream.wait_event(self._h2d_done)
+        for param_state in self.optimizer.state.values():
+            for value in param_state.values():
+                if torch.is_tensor(value) and value.device == device:
+                    value.record_stream(current_stream)
+        self._h2d_pending = False
+
+    def _release_pinned_buffers(self, wait: bool = False) -> None:
+        """
+        Free the pinned staging buffers, which are as large as the optimizer state and
+        only serve one restore, once the copies reading them have completed.
+
+        Args:
+            wait (bool): Block until the copies complete instead of keeping the buffers
+                for a later call.
+        """
+        if self._h2d_done is None:
+            return
+        if wait:
+            self._h2d_done.synchronize()
+        elif not self._h2d_done.query():
+            return
+        self._pinned_cache.clear()
+        self._h2d_done = None
+
+    def register_comm_hook(self, ddp_model: DDP, kind: str) -> None:
+        """
+        Register a DDP communication hook that compresses gradients in the all-reduce
+        overlapping the backward pass. Must be called before the first backward.
+
+        Args:
+            ddp_model (DistributedDataParallel): The DDP-wrapped model.
+            kind (str): "fp16" to all-reduce gradients in half precision, or "powersgd" for
+                rank-1 PowerSGD compression after 1000 iterations of plain all-reduce.
+        """
+        if kind == "fp16":
+            ddp_model.register_comm_hook(
+                state=None, hook=default_hooks.fp16_compress_hook
+            )
+        elif kind == "powersgd":
+            # Kept on the manager since it carries PowerSGD's error-feedback buffers
+            self.comm_hook_state = powerSGD_hook.PowerSGDState(
+                process_group=None,
+                matrix_approximation_rank=1,
+                start_powerSGD_iter=1000,
+            )
+            ddp_model.register_comm_hook(
+                state=self.comm_hook_state, hook=powerSGD_hook.powerSGD_hook
+            )
+        else:
+            raise ValueError(f"Unsupported communication hook: {kind}")
+
+        optimizer_logger.info(f"Registered {kind} DDP communication hook.")
+
+    def should_step(self, micro_idx: int, num_micro: Optional[int] = None) -> bool:
+        """
+        Whether the optimizer should step after the given micro-batch.
+
+        Args:
+            micro_idx (int): Zero-based index of the micro-batch within the epoch.
+            num_micro (int, optional): Number of micro-batches in the epoch, so the
+                trailing partial window still gets its step.
+        """
+        if (micro_idx + 1) % self.accumulation_steps == 0:
+            return True
+        return num_micro is not None and micro_idx + 1 == num_micro
+
+    def accumulate_context(
+        self, ddp_model: nn.Module, micro_idx: int, num_micro: Optional[int] = None
+    ) -> ContextManager:
+        """
+        Context for the forward/backward of one micro-batch. Skips the DDP gradient
+        all-reduce via `no_sync()` on every micro-batch that is not followed by a step.
+
+        Args:
+            ddp_model (nn.Module): The model, DDP-wrapped or not.
+            micro_idx (int): Zero-based index of the micro-batch within the epoch.
+            num_micro (int, optional): Number of micro-batches in the epoch.
+        """
+        if isinstance(ddp_model, DDP) and (
+            self._local_sgd_active() or not self.should_step(micro_idx, num_micro)
+        ):
+            return ddp_model.no_sync()
+        return contextlib.nullcontext()
+
+    def enable_local_sgd(self, period: int, warmup_steps: int, model: nn.Module) -> None:
+        """
+        Switch to local SGD: after `warmup_steps` optimizer steps with regular gradient
+        all-reduce, each rank steps on its local gradients and parameters are averaged
+        across ranks every `period` steps.
+
+        Args:
+            period (int): Number of optimizer steps between parameter averaging.
+            warmup_steps (int): Number of initial steps that keep the DDP gradient all-reduce.
+            model (nn.Module): The model whose parameters are averaged.
+        """
+        self.model_averager = PeriodicModelAverager(
+            period=period, warmup_steps=warmup_steps
+        )
+        self._averaged_model = model
+
+        optimizer_logger.info(
+            f"Local SGD enabled: averaging every {period} steps after {warmup_steps} warmup steps."
+        )
+
+    def _local_sgd_active(self) -> bool:
+        """
+        Whether local SGD has taken over gradient synchronization from DDP.
+        """
+        return (
+            self.model_averager is not None
+            and self.model_averager.step >= self.model_averager.warmup_steps
+        )
+
+    def scale_loss(self, loss: torch.Tensor) -> torch.Tensor:
+        """
+        Scale the loss before backward when float16 loss scaling is active.
+        """
+        if self.scaler is not None and self.scaler.is_enabled():
+            return self.scaler.scale(loss)
+        return loss
+
+    def unscale_(self) -> None:
+        """
+        Unscale the accumulated gradients in place, e.g. before gradient clipping.
+        """
+        if self.scaler is not None and self.scaler.is_enabled():
+            self.scaler.unscale_(self.optimizer)
 
     def step(self) -> None:
         """
         Perform a single optimization step.
         """
+        if self._h2d_pending:
+            self._wait_for_staged_state()
+        if self._pinned_cache:
+            self._release_pinned_buffers()
+
+        if self.scaler is not None and self.scaler.is_enabled():
+            # Skips the update if the scaled gradients overflowed
+            self.scaler.step(self.optimizer)
+            self.scaler.update()
+        else:
+            self.optimizer.step()
 
-        self.optimizer.step()
+        if self.model_averager is not None:
+            self.model_averager.average_parameters(
+                params=self._averaged_model.parameters()
+            )
 
     def zero_grad(self) -> None:
         """
@@ -169,28 +522,23 @@ class OptimizerManager:
         Args:
             val_loss (float): The validation loss for the current epoch.
         """
-        if (
-            self.best_loss is None
-            or val_loss < self.best_loss - self.min_loss_improvement
-        ):
+        if val_loss < self._best_threshold:
             self.best_loss = val_loss
+            self._best_threshold = val_loss - self.min_loss_improvement
             self.early_stop_counter = 0
 
-            if optimizer_logger is not None:
-                optimizer_logger.debug("New best loss recorded.")
+            optimizer_logger.debug("New best loss recorded.")
         else:
             self.early_stop_counter += 1
 
-            if optimizer_logger is not None:
-                optimizer_logger.debug(
-                    f"No improvement in loss for {self.early_stop_counter} epochs."
-                )
+            optimizer_logger.debug(
+                f"No improvement in loss for {self.early_stop_counter} epochs."
+            )
 
         if self.early_stop_counter >= self.patience:
             self.early_stop = True
 
-            if optimizer_logger is not None:
-                optimizer_logger.info("Early stopping triggered.")
+            optimizer_logger.info("Early stopping triggered.")
 
         return self.early_stop
 
@@ -206,6 +554,7 @@ class WarmUpLR(_LRScheduler):
             last_epoch (int): The index of the last epoch. Default: -1.
         """
         self.total_iters = total_iters
+        self._inv_total = 1.0 / total_iters
         super().__init__(optimizer, last_epoch)
 
     def get_lr(self):
@@ -215,12 +564,20 @@ class WarmUpLR(_LRScheduler):
         Returns:
             List of learning rates for each parameter group.
         """
+        # The warmup factor is shared by all parameter groups
         if self.last_epoch == -1:
-            return [0.0 for base_lr in self.base_lrs]
-        return [
-            base_lr * min(1.0, self.last_epoch / self.total_iters)
-            for base_lr in self.base_lrs
-        ]
+            scale = 0.0
+        else:
+            scale = min(1.0, self.last_epoch * self._inv_total)
+        return [base_lr * scale for base_lr in self.base_lrs]
+
+
+_SCHEDULER_MAP: Dict[str, Type[Any]] = {
+    "ReduceLROnPlateau": ReduceLROnPlateau,
+    "StepLR": StepLR,
+    "CosineAnnealingLR": CosineAnnealingLR,
+    "OneCycleLR": OneCycleLR,
+}
 
 
 class SchedulerManager:
@@ -233,10 +590,13 @@ class SchedulerManager:
         Initialize the SchedulerManager with the specified optimizer.
         """
         self.optimizer = optimizer
+        # The param group dict is mutated in place by schedulers, so one lookup suffices
+        self._param_group = optimizer.param_groups[0]
         self.evaluation_interval = evaluation_interval
         self.scheduler = None
         self.warmup_scheduler = None
         self.is_warmup = False
+        self._is_plateau = False
 
     def create_scheduler(
         self, scheduler_type: str, warmup_steps: int = 0, **kwargs: Any
@@ -254,31 +614,23 @@ class SchedulerManager:
             self.is_warmup = True
             self.warmup_scheduler = WarmUpLR(self.optimizer, total_iters=warmup_steps)
 
-            if optimizer_logger is not None:
-                optimizer_logger.info(
-                    f"Warmup scheduler created for the first {warmup_steps} iterations."
-                )
-
-        scheduler_map = {
-            "ReduceLROnPlateau": ReduceLROnPlateau,
-            "StepLR": StepLR,
-            "CosineAnnealingLR": CosineAnnealingLR,
-            "OneCycleLR": OneCycleLR,
-        }
+            optimizer_logger.info(
+                f"Warmup scheduler created for the first {warmup_steps} iterations."
+            )
 
-        scheduler_cls = scheduler_map.get(scheduler_type)
+        scheduler_cls = _SCHEDULER_MAP.get(scheduler_type)
         if scheduler_cls is None:
             raise ValueError(f"Unsupported scheduler type: {scheduler_type}")
 
         self.scheduler = scheduler_cls(self.optimizer, **kwargs)
+        self._is_plateau = scheduler_cls is ReduceLROnPlateau
         # Adjust patience for ReduceLROnPlateau based on evaluation interval
-        if isinstance(self.scheduler, ReduceLROnPlateau):
+        if self._is_plateau:
             self.scheduler.patience = max(
                 1, self.scheduler.patience // self.evaluation_interval
             )
 
-        if optimizer_logger is not None:
-            optimizer_logger.debug(f"Scheduler {scheduler_type} created successfully.")
+        optimizer_logger.debug(f"Scheduler {scheduler_type} created successfully.")
 
     def scheduler_step(
         self, current_epoch: int, metric: Optional[float] = None, **kwargs
@@ -291,17 +643,16 @@ class SchedulerManager:
             current_epoch (int): The current epoch number.
             metric (optional): Metric to pass to ReduceLROnPlateau scheduler.
         """
-        current_lr = self.scheduler.optimizer.param_groups[0]["lr"]
+        current_lr = self._param_group["lr"]
 
         if self.is_warmup and current_epoch <= self.warmup_scheduler.total_iters:
             self.warmup_scheduler.step(current_epoch)
 
-            if optimizer_logger is not None:
-                optimizer_logger.debug(
-                    f"Warmup scheduler step executed for epoch {current_epoch}."
-                )
+            optimizer_logger.debug(
+                f"Warmup scheduler step executed for epoch {current_epoch}."
+            )
         else:
-            if isinstance(self.scheduler, ReduceLROnPlateau):
+            if self._is_plateau:
                 if metric is None:
                     raise ValueError(
                         "metric value required for ReduceLROnPlateau scheduler."
@@ -310,13 +661,14 @@ class SchedulerManager:
             else:
                 self.scheduler.step(**kwargs)
 
-            updated_lr = self.scheduler.optimizer.param_groups[0]["lr"]
+            if not optimizer_logger.isEnabledFor(logging.INFO):
+                return
 
-            if current_lr != updated_lr:
-                if optimizer_logger is not None:
-                    optimizer_logger.info(
-                        f"Learning Rate updated from {current_lr} to {updated_lr}"
-                    )
+            updated_lr = self._param_group["lr"]
+            if abs(current_lr - updated_lr) > 1e-12:
+                optimizer_logger.info(
+                    f"Learning Rate updated from {current_lr} to {updated_lr}"
+                )
 
 
 class CriterionManager:
@@ -1,4 +1,4 @@
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import torch
 import torch.distributed as dist
@@ -80,20 +80,26 @@ def process_batch(
     criterion: torch.nn.Module,
     device: torch.device,
     is_training: bool,
+    autocast_dtype: Optional[torch.dtype] = None,
 ) -> Tuple[torch.Tensor, float, float]:
     images, target = batch
     images = images.to(device, non_blocking=True)
     target = target.to(device, non_blocking=True)
 
-    if is_training:
-        model.train()
-        output = model(images)
-    else:
-        model.eval()
-        with torch.no_grad():
+    with torch.autocast(
+        device_type=device.type,
+        dtype=autocast_dtype,
+        enabled=autocast_dtype is not None,
+    ):
+        if is_training:
+            model.train()
             output = model(images)
+        else:
+            model.eval()
+            with torch.no_grad():
+                output = model(images)
 
-    loss = criterion(output, target)
+        loss = criterion(output, target)
     acc1, acc5 = get_topk_acc(output, target, topk=(1, 5))
 
     return loss, acc1, acc5
@@ -47,7 +47,6 @@ class Trainer:
         writer: Optional[SummaryWriter],
         custom_suffix: Optional[str],
         # event_timestamp: str,
-        accum_steps: int = 5,
         train_logger: Optional[logging.Logger] = None,
         model_stats_tracker: Optional[ModelStatsTracker] = None,
         train_sampler: Optional[Sampler] = None,
@@ -86,7 +85,6 @@ class Trainer:
         # TODO: pass in
         self.writer = writer
         self.custom_suffix = custom_suffix
-        self.accum_steps = accum_steps
 
         self.train_logger = train_logger
         self.model_stats_tracker = model_stats_tracker
@@ -186,15 +184,22 @@ class Trainer:
 
             batch_start = time.time()
 
-            loss, acc1, acc5 = process_batch(
-                batch=batch,
-                model=self.model,
-                criterion=self.criterion,
-                device=self.device,
-                is_training=True,
-            )
+            # Gradients are only all-reduced on micro-batches followed by a step
+            with self.optimizer_manager.accumulate_context(
+                self.model, i, len(data_loader)
+            ):
+                loss, acc1, acc5 = process_batch(
+                    batch=batch,
+                    model=self.model,
+                    criterion=self.criterion,
+                    device=self.device,
+                    is_training=True,
+                    autocast_dtype=self.optimizer_manager.autocast_dtype,
+                )
 
-            loss.backward()
+                self.optimizer_manager.scale_loss(
+                    loss / self.optimizer_manager.accumulation_steps
+                ).backward()
 
             # Update metrics that need to be updated per batch
             batch_metric_values = {
@@ -207,11 +212,12 @@ class Trainer:
                 [top1, top5, data_loading_time, losses_meter], batch_metric_values
             )
 
-            # Perform optimizer step every accum_steps
-            if (i + 1) % self.accum_steps == 0 or (i + 1) == len(data_loader):
+            # Perform optimizer step at the end of each accumulation window
+            if self.optimizer_manager.should_step(i, len(data_loader)):
                 # Measure backward pass time
                 backward_start = time.time()
-                # Gradient clipping
+                # Gradient clipping on unscaled gradients
+                self.optimizer_manager.unscale_()
                 torch.nn.utils.clip_grad_norm_(self.model.parameters(), max_norm=0.1)
 
                 self.optimizer_manager.step()
@@ -317,6 +323,7 @@ class Trainer:
                 criterion=self.criterion,
                 device=self.device,
                 is_training=False,
+                autocast_dtype=self.optimizer_manager.autocast_dtype,
             )
 
             # Update the meters
@@ -765,7 +772,7 @@ class Trainer:
             "best_acc1": best_acc1,
             "arch": self.arch,
             "state_dict": model_state_dict,
-            "optimizer": self.optimizer_manager.optimizer.state_dict(),
+            "optimizer": self.optimizer_manager.state_dict(),
             "scheduler": self.scheduler_manager.scheduler.state_dict()
             if self.scheduler_manager
             else None,
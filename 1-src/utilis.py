@@ -40,7 +40,8 @@ def load_checkpoint(ckpt_path: str) -> Tuple[Dict, Dict, int, Optional[float]]:
     if utilis_worker is not None:
         utilis_worker.info(f"=> Loading checkpoint '{ckpt_path}'")
 
-    checkpoint = torch.load(ckpt_path)
+    # Load onto the host; tensors are moved to each rank's own device when restored
+    checkpoint = torch.load(ckpt_path, map_location="cpu")
 
     model_state_dict = checkpoint.get("state_dict")
     optimizer_state_dict = checkpoint.get("optimizer")
@@ -94,7 +94,6 @@ class Worker:
         self.batch_size = training_config["batch_size"]
         # NOTE: batch size is the total batch size , adjusted for distributed training in each process
         self.adjusted_batch_size = self.batch_size // self.ngpus_per_node
-        self.accum_steps = training_config["accum_steps"]
         self.verbose = training_config["verbose"]
         self.seed = training_config["seed"]
         self.hist_save_interval = training_config["hist_save_interval"]
@@ -123,6 +122,8 @@ class Worker:
         model_config = self.config["model"]
         self.arch = model_config["arch"]
         self.pretrained = model_config["pretrained"]
+        self.channels_last = model_config.get("channels_last", False)
+        self.bf16 = model_config.get("bf16", False)
 
         # Optimizer
         optimizer_config = self.config["optimizer"]
@@ -231,9 +232,8 @@ class Worker:
         if device_type == "npu":
             loc = f"npu:{self.gpu}"
             try:
+                # The process is already bound to this NPU by `torch.npu.set_device` in main
                 import torch_npu  # noqa
-
-                torch.npu.set_device(loc)
             except ImportError as e:
                 self.worker_logger.error(f"Failed to import torch_npu: {e}")
                 raise
@@ -269,8 +269,8 @@ class Worker:
         # Get the data loaders
         # NOTE:
         """
-        Validation set doesn't use distributed sampler and should be evaluated on single GPU.
-        Train and Test sets should be evaluated on all GPUs.
+        Train, validation and test sets are all sharded across ranks with the per-rank batch size,
+        and evaluation metrics are all-reduced by the trainer.
         """
         (
             train_loader,
@@ -286,6 +286,12 @@ class Worker:
             train_ratio=self.train_ratio,
             distributed=self.distributed,
             transform=None,
+            device=self.device,
+            seed=self.seed,
+            dtype=torch.bfloat16 if self.bf16 else torch.float32,
+            memory_format=(
+                torch.channels_last if self.channels_last else torch.contiguous_format
+            ),
         )
 
         # Logging dataset sizes and confirmation
@@ -342,23 +348,24 @@ class Worker:
         ckpt_path = self.ckpt_path
         if ckpt_path:
             # Attempt to load the checkpoint data
-            state = load_checkpoint(ckpt_path=ckpt_path)
-            if state:
-                # Todo: Notice the '.module' settings of state_dict for DDP models.
-                # Update the model state
-                if "model_state_dict" in state:
-                    self.model.load_state_dict(state_dict=state["model_state_dict"])
-                    self.worker_logger.debug(
-                        f"Model state updated from checkpoint at {ckpt_path}."
-                    )
-
-                # Update the optimizer state
-                if "optimizer_state_dict" in state:
-                    self.optimizer_manager.update_optimizer_state(
-                        optimizer_state_dict=state["optimizer_state_dict"],
-                        params_to_restore=["lr"],
-                    )
-                    self.worker_logger.debug("Optimizer state updated from checkpoint.")
+            model_state_dict, optimizer_state_dict, _, _ = load_checkpoint(
+                ckpt_path=ckpt_path
+            )
+            # Update the model state; checkpoints store the state_dict of the unwrapped model
+            if model_state_dict is not None:
+                model = self.model.module if hasattr(self.model, "module") else self.model
+                model.load_state_dict(state_dict=model_state_dict)
+                self.worker_logger.debug(
+                    f"Model state updated from checkpoint at {ckpt_path}."
+                )
+
+            # Update the optimizer state (and the loss scaler state stored with it)
+            if optimizer_state_dict is not None:
+                self.optimizer_manager.update_optimizer_state(
+                    optimizer_state_dict=optimizer_state_dict,
+                    params_to_restore=["lr"],
+                )
+                self.worker_logger.debug("Optimizer state updated from checkpoint.")
 
     def setup_scheduler(self):
         """
@@ -422,7 +429,8 @@ class Worker:
     def setup_benchmark_and_stats_tracker(self):
         # Disable benchmark for specific devices (e.g., NPU)
         torch.backends.cudnn.benchmark = False
-        # Check configuration for enabling ModelStatsTracker
+        # Check configuration for enabling ModelStatsTracker; its per-module hooks sync the
+        # device on every layer, so it stays opt-in through `track_model_stats`
         if self.track_model_stats:
             self.model_stats_tracker = ModelStatsTracker(model=self.model)
             self.worker_logger.debug("ModelStatsTracker is enabled.")
@@ -496,7 +504,6 @@ class Worker:
             amp=self.amp,
             writer=self.writer,
             custom_suffix=self.custom_suffix,
-            accum_steps=self.accum_steps,
             hist_save_interval=self.hist_save_interval,
             eval_interval=self.eval_interval,
             debug_mode=self.debug_mode,